@@ -15,11 +15,14 @@ from __future__ import annotations
 import logging
 from typing import Optional
 
-from . import config
+import config
 
 
 logger = logging.getLogger(__name__)
 
+# Order sides accepted by ``submit_order``.
+_VALID_SIDES = frozenset({"buy", "sell"})
+
 
 def submit_order(symbol: str, side: str, quantity: int, dry_run: bool = False) -> None:
     """Send an order to the broker or log it if dry‑run.
@@ -37,13 +40,13 @@ def submit_order(symbol: str, side: str, quantity: int, dry_run: bool = False) -
         contact the broker.  This is useful for testing.
     """
     side = side.lower()
-    if side not in {"buy", "sell"}:
+    if side not in _VALID_SIDES:
         logger.error("Invalid order side: %s", side)
         return
     if quantity <= 0:
         logger.error("Quantity must be positive: %s", quantity)
         return
-    if dry_run or not config.is_autopilot_enabled():
+    if dry_run or not config.AUTOPILOT_ENABLED:
         logger.info("DRY RUN: Would %s %d shares of %s", side, quantity, symbol)
         return
     # Placeholder for broker integration.  Replace this with actual
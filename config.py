@@ -13,6 +13,11 @@ UNUSUAL_WHALES_API_KEY : str or None
     application will not attempt to query Unusual Whales and will
     instead return stub data.
 
+UNUSUAL_WHALES_STREAM : bool
+    When ``True`` (and an API key is configured) options flow is read
+    from a background WebSocket subscription instead of being polled
+    over REST.  Set via the ``UW_STREAM`` environment variable.
+
 BROKER_API_KEY : str or None
 BROKER_API_SECRET : str or None
     Credentials for your brokerage API.  If these values are not
@@ -25,10 +30,15 @@ BROKER_PAPER : bool
     sandbox endpoints where available.  If no paper endpoint exists
     the autopilot will warn and skip order submission.
 
-WATCHLIST : list[str]
-    A list of ticker symbols to monitor.  These symbols should be
+AUTOPILOT_ENABLED : bool
+    ``True`` when both broker credentials are configured.  Resolved
+    once at import; see :func:`is_autopilot_enabled`.
+
+WATCHLIST : tuple[str, ...]
+    The ticker symbols to monitor.  These symbols should be
     recognised by the underlying data providers.  Defaults to a few
-    widely traded equities.
+    widely traded equities.  A tuple, so it is hashable and can be
+    used directly as a cache key.
 
 SENTIMENT_THRESHOLD : float
     The minimum sentiment score required to consider Reddit sentiment
@@ -36,12 +46,22 @@ SENTIMENT_THRESHOLD : float
     bullish discussion, while values less than the negative of this
     threshold indicate bearishness.
 
+POLL_INTERVAL : float
+    Maximum age in seconds of cached options flow and Reddit
+    sentiment.  It is the TTL of the dashboard's flow and sentiment
+    caches and of cached Unusual Whales responses, so data older than
+    this is fetched again.  Set via the ``POLL_INTERVAL`` environment
+    variable.  Use lower values for live trading and higher values for
+    batch or offline use.
+
 """
 
+import functools
 import os
-from typing import List
+from typing import Tuple
 
 
+@functools.lru_cache(maxsize=None)
 def _get_env(key: str, default: str | None = None) -> str | None:
     """Return the value of the environment variable ``key``.
 
@@ -60,6 +80,11 @@ def _get_env(key: str, default: str | None = None) -> str | None:
     -------
     str or None
         The value of the environment variable or ``default``.
+
+    Notes
+    -----
+    Results are memoised, so changes to the environment after the
+    first lookup of ``key`` are not observed.
     """
     value = os.getenv(key)
     if value is None or value == "":
@@ -68,38 +93,48 @@ def _get_env(key: str, default: str | None = None) -> str | None:
 
 
 UNUSUAL_WHALES_API_KEY: str | None = _get_env("UW_API_KEY")
+UNUSUAL_WHALES_STREAM: bool = os.getenv("UW_STREAM", "0") not in {"", "0", "false", "False"}
 
 # Placeholder broker credentials.  Replace these with your actual
 # brokerage keys or set the corresponding environment variables.
 BROKER_API_KEY: str | None = _get_env("BROKER_API_KEY")
 BROKER_API_SECRET: str | None = _get_env("BROKER_API_SECRET")
+AUTOPILOT_ENABLED: bool = BROKER_API_KEY is not None and BROKER_API_SECRET is not None
 BROKER_PAPER: bool = os.getenv("BROKER_PAPER", "1") not in {"", "0", "false", "False"}
 
 # List of tickers to watch.  Use environment variable WATCHLIST to
 # override as comma‑separated symbols.  Example:
-# ``WATCHLIST="AAPL,MSFT,TSLA" python -m trading_project.main``
+# ``WATCHLIST="AAPL,MSFT,TSLA" python main.py``
 _watchlist_env = _get_env("WATCHLIST")
 if _watchlist_env:
-    WATCHLIST: List[str] = [symbol.strip().upper() for symbol in _watchlist_env.split(",") if symbol.strip()]
+    WATCHLIST: Tuple[str, ...] = tuple(
+        symbol.strip().upper() for symbol in _watchlist_env.split(",") if symbol.strip()
+    )
 else:
-    WATCHLIST: List[str] = ["AAPL", "MSFT", "TSLA"]
+    WATCHLIST: Tuple[str, ...] = ("AAPL", "MSFT", "TSLA")
 
 # Sentiment threshold.  The strategy will treat scores above this value
 # as bullish and below the negative value as bearish.
 SENTIMENT_THRESHOLD: float = float(os.getenv("SENTIMENT_THRESHOLD", "0.2"))
 
+# Maximum age in seconds of cached flow and sentiment data.
+POLL_INTERVAL: float = float(os.getenv("POLL_INTERVAL", "5.0"))
+
 
 def is_autopilot_enabled() -> bool:
     """Return ``True`` if automatic trade execution is configured."""
-    return BROKER_API_KEY is not None and BROKER_API_SECRET is not None
+    return AUTOPILOT_ENABLED
 
 
 __all__ = [
     "UNUSUAL_WHALES_API_KEY",
+    "UNUSUAL_WHALES_STREAM",
     "BROKER_API_KEY",
     "BROKER_API_SECRET",
     "BROKER_PAPER",
+    "AUTOPILOT_ENABLED",
     "WATCHLIST",
     "SENTIMENT_THRESHOLD",
+    "POLL_INTERVAL",
     "is_autopilot_enabled",
 ]
\ No newline at end of file
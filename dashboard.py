@@ -1,5 +1,69 @@
+import asyncio
+
 import streamlit as st
-import config, unusual_whales, reddit, fundamentals
+import config, autopilot
+from dashboard_cache import cached_flow, cached_fund_batch, cached_sentiment, cached_signal
+
+
+async def fetch_symbol_data(symbol, fund_batch):
+    """Fetch flow, sentiment and fundamentals for ``symbol`` concurrently.
+
+    The cached fetchers are blocking, so each runs in a worker thread;
+    cache hits return immediately without touching the network.
+    ``fund_batch`` is a shared task resolving to the batched
+    fundamentals for all symbols.
+    """
+    flows, sentiment, funds = await asyncio.gather(
+        asyncio.to_thread(cached_flow, symbol),
+        asyncio.to_thread(cached_sentiment, symbol),
+        fund_batch,
+    )
+    return symbol, (flows, sentiment, funds.get(symbol))
+
+
+async def fetch_all(symbols, on_result):
+    """Fetch data for every symbol concurrently.
+
+    ``on_result(symbol, result)`` is called as soon as each symbol's
+    data arrives, so a slow symbol does not hold back the others.
+    Fundamentals for all symbols come from a single batched request.
+    """
+    fund_batch = asyncio.ensure_future(asyncio.to_thread(cached_fund_batch, tuple(symbols)))
+    for next_done in asyncio.as_completed([fetch_symbol_data(s, fund_batch) for s in symbols]):
+        symbol, result = await next_done
+        on_result(symbol, result)
+
+
+def render_symbol(symbol, flows, sentiment, fund):
+    """Render the analysis for one symbol and act on its signal."""
+    st.subheader(f"Analysis for {symbol}")
+
+    # Options flow data
+    st.write("Options Flow", flows if flows else "No data or API key missing")
+
+    # Reddit sentiment
+    st.metric("Reddit Sentiment Score", f"{sentiment:.2f}")
+
+    # Fundamental data
+    if fund:
+        st.write("Fundamentals", fund)
+    else:
+        st.warning("Could not retrieve fundamentals.")
+
+    # Generate trading signal
+    signal_result = cached_signal(symbol, flows, sentiment, fund)
+    st.success(f"Signal: {signal_result['signal'].upper()}")
+    st.caption(f"Reason: {signal_result['reason']}")
+
+    # Optional autopilot trade execution
+    if signal_result['signal'] in ['buy', 'sell']:
+        if run_autopilot:
+            autopilot.submit_order(symbol, signal_result['signal'], quantity=1)
+            st.info(f"Executed {signal_result['signal']} 1 unit of {symbol}")
+        else:
+            st.info(f"[Dry-run] Would {signal_result['signal']} {symbol}")
+    st.divider()
+
 
 # Set up the dashboard
 st.set_page_config(page_title="Trading Signals Assistant", layout="wide")
@@ -11,36 +75,16 @@ symbols = st.sidebar.multiselect("Select symbols:", options=config.WATCHLIST, de
 run_autopilot = st.sidebar.checkbox("Enable Autopilot", value=config.is_autopilot_enabled())
 
 if st.button("Run Analysis"):
-    for symbol in symbols:
-        st.subheader(f"Analysis for {symbol}")
+    # Lay out a placeholder per symbol first so the page paints
+    # immediately, then fill each slot as its data arrives.
+    placeholders = {s: st.empty() for s in symbols}
+    for s in symbols:
+        placeholders[s].status(f"Analyzing {s}…", expanded=False)
 
-        # Fetch options flow data
-        flows = unusual_whales.get_recent_flow(symbol)
-        st.write("Options Flow", flows if flows else "No data or API key missing")
+    def show(symbol, result):
+        with placeholders[symbol].container():
+            render_symbol(symbol, *result)
 
-        # Compute Reddit sentiment
-        sentiment = reddit.get_sentiment_for_symbol(symbol)
-        st.metric("Reddit Sentiment Score", f"{sentiment:.2f}")
-
-        # Fetch fundamental data
-        fund = fundamentals.get_fundamentals(symbol)
-        if fund:
-            st.write("Fundamentals", fund)
-        else:
-            st.warning("Could not retrieve fundamentals.")
-
-        # Generate trading signal
-        signal_result = strategy.generate_signal(symbol, flows, sentiment, fund)
-        st.success(f"Signal: {signal_result['signal'].upper()}")
-        st.caption(f"Reason: {signal_result['reason']}")
-
-        # Optional autopilot trade execution
-        if signal_result['signal'] in ['buy', 'sell']:
-            if run_autopilot:
-                autopilot.submit_order(symbol, signal_result['signal'], quantity=1)
-                st.info(f"Executed {signal_result['signal']} 1 unit of {symbol}")
-            else:
-                st.info(f"[Dry-run] Would {signal_result['signal']} {symbol}")
-        st.divider()
+    asyncio.run(fetch_all(symbols, show))
 else:
     st.info("Click the 'Run Analysis' button to start.")
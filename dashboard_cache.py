@@ -0,0 +1,68 @@
+"""Streamlit caching wrappers for the dashboard's data fetches.
+
+Streamlit re-executes ``dashboard.py`` on every widget interaction.
+The helpers in this module memoise the network-bound fetchers with
+``st.cache_data`` so that reruns within the TTL window reuse earlier
+results instead of hitting the remote APIs again.  Options flow and
+sentiment expire after ``config.POLL_INTERVAL`` seconds; fundamentals
+change slowly and are kept for five minutes.
+
+Spinners are disabled because the dashboard calls these helpers from
+worker threads, where Streamlit cannot render elements.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+import streamlit as st
+
+import config
+import fundamentals
+import reddit
+import strategy
+import unusual_whales
+
+
+@st.cache_data(ttl=config.POLL_INTERVAL, show_spinner=False)
+def _cached_flow(symbol: str) -> List[Dict[str, Any]]:
+    return unusual_whales.get_recent_flow(symbol)
+
+
+def cached_flow(symbol: str) -> List[Dict[str, Any]]:
+    """Return recent options flow for ``symbol``, cached for ``POLL_INTERVAL``.
+
+    With ``config.UNUSUAL_WHALES_STREAM`` enabled the flow is served
+    from the in-memory WebSocket buffer, which is always current, so
+    it bypasses the cache.
+    """
+    if config.UNUSUAL_WHALES_STREAM:
+        return unusual_whales.get_recent_flow(symbol)
+    return _cached_flow(symbol)
+
+
+@st.cache_data(ttl=config.POLL_INTERVAL, show_spinner=False)
+def cached_sentiment(symbol: str) -> float:
+    """Return Reddit sentiment for ``symbol``, cached for ``POLL_INTERVAL``."""
+    return reddit.get_sentiment_for_symbol(symbol)
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def cached_fund_batch(symbols: Tuple[str, ...]) -> Dict[str, Dict[str, float]]:
+    """Return fundamentals for all ``symbols``, cached for 300 seconds."""
+    return fundamentals.get_fundamentals_batch(symbols)
+
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def cached_signal(
+    symbol: str,
+    flows: List[Dict[str, Any]],
+    sentiment: float,
+    fund: Optional[Dict[str, float]],
+) -> Dict[str, Any]:
+    """Return the strategy signal, keyed on the symbol and all its inputs.
+
+    Only the 256 most recent input combinations are kept.
+    """
+    return strategy.generate_signal(symbol, flows, sentiment, fund)
+
+
+__all__ = ["cached_flow", "cached_sentiment", "cached_fund_batch", "cached_signal"]
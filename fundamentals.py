@@ -1,11 +1,16 @@
-"""Fundamental data retrieval using Yahoo! Finance."""
+"""Fundamental data retrieval using Yahoo! Finance."""
 
 from __future__ import annotations
 
 import logging
-from typing import Dict, Optional
+from datetime import timedelta
+from typing import Any, Dict, Iterable, Optional
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from requests_cache import CachedSession
+from urllib3.util.retry import Retry
 
 
 logger = logging.getLogger(__name__)
@@ -15,13 +20,106 @@ logger = logging.getLogger(__name__)
 # avoid making excessive requests in quick succession.
 YAHOO_QUOTE_URL = "https://query1.finance.yahoo.com/v7/finance/quote"
 
+# Errors that make a fetch return its empty fallback.  Malformed JSON
+# surfaces as ``orjson.JSONDecodeError``, a ``ValueError`` subclass.
+_SYNC_ERRORS = (requests.RequestException, ValueError)
+
+# Shared HTTP session.  Reusing a session keeps connections alive
+# between calls so only the first request pays the TCP/TLS handshake.
+# Fundamentals change slowly, so responses are also cached on disk for
+# an hour (or as the server's cache headers dictate), letting repeated
+# runs skip the network entirely.  The cache lives in the user's cache
+# directory so it does not depend on the working directory.
+_SESSION = CachedSession(
+    "trading_assistant_fundamentals",
+    use_cache_dir=True,
+    backend="sqlite",
+    expire_after=timedelta(hours=1),
+    allowable_codes=(200,),
+    cache_control=True,
+)
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[429, 502, 503, 504]),
+    ),
+)
+
+
+def _extract_fundamentals(info: Dict[str, Any]) -> Dict[str, float]:
+    """Select the metrics of interest from a single quote result."""
+    # Select a subset of available metrics.  Additional fields can be
+    # added here as needed.  Missing values default to None.
+    fundamentals: Dict[str, float] = {}
+    def _maybe_float(key: str) -> Optional[float]:
+        value = info.get(key)
+        return float(value) if isinstance(value, (int, float)) else None
+    fundamentals["regularMarketPrice"] = _maybe_float("regularMarketPrice")
+    fundamentals["marketCap"] = _maybe_float("marketCap")
+    fundamentals["trailingPE"] = _maybe_float("trailingPE")
+    fundamentals["forwardPE"] = _maybe_float("forwardPE")
+    fundamentals["epsTrailingTwelveMonths"] = _maybe_float("epsTrailingTwelveMonths")
+    fundamentals["epsForward"] = _maybe_float("epsForward")
+    fundamentals["profitMargins"] = _maybe_float("profitMargins")
+    fundamentals["pegRatio"] = _maybe_float("pegRatio")
+    fundamentals["bookValue"] = _maybe_float("bookValue")
+    return fundamentals
+
+
+def _extract_batch(quote_data: Any) -> Dict[str, Dict[str, float]]:
+    """Map each symbol in a quote response payload to its metrics."""
+    quote_response = quote_data.get("quoteResponse") if isinstance(quote_data, dict) else None
+    results = quote_response.get("result") if isinstance(quote_response, dict) else None
+    if not isinstance(results, list):
+        logger.warning("Unexpected quote response format: %s", quote_data)
+        return {}
+    return {
+        info["symbol"].upper(): _extract_fundamentals(info)
+        for info in results
+        if isinstance(info, dict) and isinstance(info.get("symbol"), str)
+    }
+
+
+def get_fundamentals_batch(symbols: Iterable[str]) -> Dict[str, Dict[str, float]]:
+    """Return basic fundamental metrics for several symbols at once.
+
+    Yahoo! Finance's quote endpoint accepts a comma separated list of
+    symbols, so the whole batch is fetched in a single request.
+
+    Parameters
+    ----------
+    symbols : iterable of str
+        The ticker symbols to query.
+
+    Returns
+    -------
+    dict
+        Maps each upper‑cased symbol to a dictionary of metrics (see
+        :func:`get_fundamentals`).  Symbols that were not found are
+        omitted; the result is empty if the request fails.
+    """
+    joined = ",".join(symbol.upper() for symbol in symbols)
+    if not joined:
+        return {}
+    params = {"symbols": joined}
+    try:
+        response = _SESSION.get(YAHOO_QUOTE_URL, params=params, timeout=10)
+        response.raise_for_status()
+        return _extract_batch(orjson.loads(response.content))
+    except _SYNC_ERRORS as exc:
+        logger.error("Failed to fetch fundamentals for %s: %s", joined, exc)
+        return {}
+
 
 def get_fundamentals(symbol: str) -> Optional[Dict[str, float]]:
     """Return basic fundamental metrics for a stock symbol.
 
-    The function fetches data from Yahoo! Finance's quote endpoint and
+    The function fetches data from Yahoo! Finance's quote endpoint and
     extracts a handful of useful metrics.  If the request fails or the
-    symbol is not found, ``None`` is returned.
+    symbol is not found, ``None`` is returned.  Prefer
+    :func:`get_fundamentals_batch` when querying several symbols.
 
     Parameters
     ----------
@@ -34,34 +132,10 @@ def get_fundamentals(symbol: str) -> Optional[Dict[str, float]]:
         A dictionary of metrics.  See the code for exact keys.  ``None``
         indicates that no data could be retrieved.
     """
-    params = {"symbols": symbol.upper()}
-    try:
-        response = requests.get(YAHOO_QUOTE_URL, params=params, timeout=10)
-        response.raise_for_status()
-        quote_data = response.json()
-        results = quote_data.get("quoteResponse", {}).get("result", [])
-        if not results:
-            return None
-        info = results[0]
-        # Select a subset of available metrics.  Additional fields can be
-        # added here as needed.  Missing values default to None.
-        fundamentals: Dict[str, float] = {}
-        def _maybe_float(key: str) -> Optional[float]:
-            value = info.get(key)
-            return float(value) if isinstance(value, (int, float)) else None
-        fundamentals["regularMarketPrice"] = _maybe_float("regularMarketPrice")
-        fundamentals["marketCap"] = _maybe_float("marketCap")
-        fundamentals["trailingPE"] = _maybe_float("trailingPE")
-        fundamentals["forwardPE"] = _maybe_float("forwardPE")
-        fundamentals["epsTrailingTwelveMonths"] = _maybe_float("epsTrailingTwelveMonths")
-        fundamentals["epsForward"] = _maybe_float("epsForward")
-        fundamentals["profitMargins"] = _maybe_float("profitMargins")
-        fundamentals["pegRatio"] = _maybe_float("pegRatio")
-        fundamentals["bookValue"] = _maybe_float("bookValue")
-        return fundamentals
-    except Exception as exc:
-        logger.error("Failed to fetch fundamentals for %s: %s", symbol, exc)
-        return None
-
-
-__all__ = ["get_fundamentals"]
\ No newline at end of file
+    return get_fundamentals_batch([symbol]).get(symbol.upper())
+
+
+__all__ = [
+    "get_fundamentals",
+    "get_fundamentals_batch",
+]
@@ -5,16 +5,19 @@ from __future__ import annotations
 import argparse
 import logging
 import sys
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence
 
-from . import (
-    autopilot,
-    config,
-    fundamentals,
-    reddit,
-    strategy,
-    unusual_whales,
-)
+import autopilot
+import config
+import fundamentals
+import reddit
+import strategy
+import unusual_whales
+
+
+# Upper bound on worker threads used to fetch data in parallel.
+MAX_WORKERS = 8
 
 
 def setup_logging(verbose: bool = False) -> None:
@@ -28,15 +31,18 @@ def setup_logging(verbose: bool = False) -> None:
     )
 
 
-def process_symbol(symbol: str, dry_run: bool = False) -> None:
-    """Fetch data, generate a signal and optionally execute a trade."""
-    logging.info("\nProcessing %s", symbol)
-    flows = unusual_whales.get_recent_flow(symbol)
-    sentiment_score = reddit.get_sentiment_for_symbol(symbol)
-    fundamentals_data = fundamentals.get_fundamentals(symbol)
+def _act_on_data(
+    symbol: str,
+    flows: List[Dict[str, Any]],
+    sentiment_score: float,
+    fundamentals_data: Optional[Dict[str, float]],
+    dry_run: bool = False,
+) -> None:
+    """Generate a signal from fetched data and optionally execute a trade."""
     signal_data = strategy.generate_signal(symbol, flows, sentiment_score, fundamentals_data)
-    logging.info("Signal for %s: %s", symbol, signal_data["signal"])
-    logging.info("Reason: %s", signal_data["reason"])
+    # Log the signal and its reason as one record so every reason names
+    # its symbol.
+    logging.info("Signal for %s: %s (%s)", symbol, signal_data["signal"], signal_data["reason"])
     # Decide whether to place an order
     if signal_data["signal"] in {"buy", "sell"}:
         # Determine a default quantity.  For demonstration we trade 1 share.
@@ -46,6 +52,27 @@ def process_symbol(symbol: str, dry_run: bool = False) -> None:
         logging.info("No trade executed for %s.", symbol)
 
 
+def process_symbol(
+    symbol: str,
+    dry_run: bool = False,
+    fundamentals_batch: Optional[Dict[str, Dict[str, float]]] = None,
+) -> None:
+    """Fetch data, generate a signal and optionally execute a trade.
+
+    ``fundamentals_batch`` may hold the result of
+    :func:`fundamentals.get_fundamentals_batch`; when omitted the
+    symbol's fundamentals are fetched individually.
+    """
+    logging.info("\nProcessing %s", symbol)
+    flows = unusual_whales.get_recent_flow(symbol)
+    sentiment_score = reddit.get_sentiment_for_symbol(symbol)
+    if fundamentals_batch is None:
+        fundamentals_data = fundamentals.get_fundamentals(symbol)
+    else:
+        fundamentals_data = fundamentals_batch.get(symbol.upper())
+    _act_on_data(symbol, flows, sentiment_score, fundamentals_data, dry_run=dry_run)
+
+
 def main(argv: List[str] | None = None) -> int:
     parser = argparse.ArgumentParser(description="Run the trading signals assistant.")
     parser.add_argument(
@@ -66,13 +93,43 @@ def main(argv: List[str] | None = None) -> int:
     args = parser.parse_args(argv)
     setup_logging(args.verbose)
     # Determine which symbols to process
+    symbols: Sequence[str]
     if args.symbols:
-        symbols = [s.strip().upper() for s in args.symbols.split(",") if s.strip()]
+        symbols = tuple(s.strip().upper() for s in args.symbols.split(",") if s.strip())
     else:
         symbols = config.WATCHLIST
     logging.info("Starting trading assistant for symbols: %s", ", ".join(symbols))
-    for symbol in symbols:
-        process_symbol(symbol, dry_run=args.dry_run)
+    if args.verbose:
+        # Process serially so that debug output stays grouped per symbol.
+        # One Yahoo request covers every symbol.
+        fundamentals_batch = fundamentals.get_fundamentals_batch(symbols)
+        for symbol in symbols:
+            process_symbol(symbol, dry_run=args.dry_run, fundamentals_batch=fundamentals_batch)
+    else:
+        # Every fetch is dominated by blocking network I/O, so submit
+        # them all to a thread pool: the fundamentals batch and each
+        # symbol's Unusual Whales and Reddit calls overlap one another.
+        # Signals are then generated and acted on here, in order.
+        with ThreadPoolExecutor(max_workers=min(2 * len(symbols) + 1, MAX_WORKERS)) as executor:
+            fundamentals_future = executor.submit(fundamentals.get_fundamentals_batch, symbols)
+            pending = [
+                (
+                    symbol,
+                    executor.submit(unusual_whales.get_recent_flow, symbol),
+                    executor.submit(reddit.get_sentiment_for_symbol, symbol),
+                )
+                for symbol in symbols
+            ]
+            fundamentals_batch = fundamentals_future.result()
+            for symbol, flows, sentiment_score in pending:
+                logging.info("\nProcessing %s", symbol)
+                _act_on_data(
+                    symbol,
+                    flows.result(),
+                    sentiment_score.result(),
+                    fundamentals_batch.get(symbol.upper()),
+                    dry_run=args.dry_run,
+                )
     logging.info("All symbols processed.  Exiting.")
     return 0
 
@@ -13,9 +13,16 @@ from __future__ import annotations
 
 import logging
 import re
+from collections import Counter
 from typing import Dict, Iterable, List, Optional
 
-import requests
+import httpx
+import ijson
+
+try:
+    import ahocorasick
+except ImportError:  # optional dependency; fall back to the tokenizer
+    ahocorasick = None
 
 
 logger = logging.getLogger(__name__)
@@ -27,6 +34,32 @@ REDDIT_SEARCH_URL = (
     "https://www.reddit.com/r/wallstreetbets+stocks+options+investing/search.json"
 )
 
+# Errors that make a fetch return its empty fallback.  Transport
+# failures while the listing streams in are ``httpx.HTTPError`` too.
+# ``ijson.JSONError`` covers malformed or truncated JSON.
+_SYNC_ERRORS = (httpx.HTTPError, ijson.JSONError, ValueError)
+
+# Reddit rejects requests without a descriptive User-Agent.
+_USER_AGENT = "Mozilla/5.0 (compatible; TradingBot/1.0; +https://example.com)"
+_HEADERS: Dict[str, str] = {"User-Agent": _USER_AGENT}
+
+# Shared HTTP/2 client.  Reusing a client keeps connections alive
+# between calls so only the first request pays the TCP/TLS handshake,
+# and HTTP/2 multiplexes the searches that ``main`` issues from its
+# thread pool over that one connection instead of opening one per
+# worker.  Unlike the cached sessions in ``fundamentals`` and
+# ``unusual_whales`` this one has no on-disk cache to keep, so it need
+# not be a ``requests`` session.  Retries cover connection failures.
+_CLIENT = httpx.Client(
+    headers=_HEADERS,
+    timeout=10,
+    transport=httpx.HTTPTransport(
+        http2=True,
+        retries=2,
+        limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+    ),
+)
+
 # A simple lexicon for naive sentiment analysis.  Each keyword has a
 # corresponding weight.  These weights were chosen heuristically and
 # can be adjusted to better reflect the community's language.
@@ -56,6 +89,68 @@ NEGATIVE_KEYWORDS: Dict[str, float] = {
     "crash": 0.4,
 }
 
+# Derived lookup tables for ``compute_sentiment``.  Positive and
+# negative weights are merged into one signed table so each token needs
+# a single lookup, and the normalisation constant (the larger of the
+# summed positive and negative weights) is computed once.
+_TOKEN_RE = re.compile(r"[^a-z0-9$]+")
+_WEIGHTS: Dict[str, float] = {
+    word: POSITIVE_KEYWORDS.get(word, 0.0) - NEGATIVE_KEYWORDS.get(word, 0.0)
+    for word in {**POSITIVE_KEYWORDS, **NEGATIVE_KEYWORDS}
+}
+_MAX_SCORE = max(sum(POSITIVE_KEYWORDS.values()), sum(NEGATIVE_KEYWORDS.values()))
+
+# Characters that make up a token; anything else acts as a separator.
+# Must agree with ``_TOKEN_RE``.
+_TOKEN_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz0123456789$")
+
+
+def _build_automaton() -> Optional["ahocorasick.Automaton"]:
+    """Return an Aho‑Corasick automaton over the lexicon, if available.
+
+    Each keyword maps to its length and signed weight so that matches
+    can be boundary‑checked and scored without further lookups.
+    """
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for word, weight in _WEIGHTS.items():
+        automaton.add_word(word, (len(word), weight))
+    automaton.make_automaton()
+    return automaton
+
+
+_AUTOMATON = _build_automaton()
+
+
+def _score_text(lowered: str) -> float:
+    """Return the summed keyword weights of a lower‑cased text.
+
+    Uses a single Aho‑Corasick scan when ``pyahocorasick`` is installed
+    and falls back to tokenising with ``_TOKEN_RE`` otherwise.  Matches
+    are only counted when they span a whole token, so both paths
+    produce the same score.
+    """
+    if _AUTOMATON is None:
+        # Count tokens in C, then weigh only the handful of lexicon
+        # words instead of looking up every token.
+        counts = Counter(_TOKEN_RE.split(lowered))
+        return sum(weight * counts[word] for word, weight in _WEIGHTS.items() if word in counts)
+    token_chars = _TOKEN_CHARS
+    last = len(lowered) - 1
+    score = 0.0
+    for end, (length, weight) in _AUTOMATON.iter(lowered):
+        start = end - length + 1
+        if (start == 0 or lowered[start - 1] not in token_chars) and (
+            end == last or lowered[end + 1] not in token_chars
+        ):
+            score += weight
+    return score
+
+
+# ijson prefix addressing each post title in a Reddit listing.
+_TITLE_PREFIX = "data.children.item.data.title"
+
 
 def fetch_recent_posts(symbol: str, limit: int = 50) -> List[str]:
     """Fetch recent Reddit post titles mentioning a symbol.
@@ -84,22 +179,18 @@ def fetch_recent_posts(symbol: str, limit: int = 50) -> List[str]:
         "sort": "new",
         "limit": str(limit),
     }
-    headers = {
-        "User-Agent": "Mozilla/5.0 (compatible; TradingBot/1.0; +https://example.com)"
-    }
     try:
-        response = requests.get(REDDIT_SEARCH_URL, params=params, headers=headers, timeout=10)
-        response.raise_for_status()
-        data = response.json()
-        children = data.get("data", {}).get("children", [])
-        posts: List[str] = []
-        for child in children:
-            post_data = child.get("data", {})
-            title = post_data.get("title")
-            if isinstance(title, str):
-                posts.append(title)
-        return posts
-    except Exception as exc:
+        # Stream the listing and pull out only the titles rather than
+        # decoding the full (large) payload into Python objects.
+        titles = ijson.sendable_list()
+        parser = ijson.items_coro(titles, _TITLE_PREFIX)
+        with _CLIENT.stream("GET", REDDIT_SEARCH_URL, params=params) as response:
+            response.raise_for_status()
+            for chunk in response.iter_bytes():
+                parser.send(chunk)
+        parser.close()
+        return [title for title in titles if isinstance(title, str)]
+    except _SYNC_ERRORS as exc:
         logger.error("Failed to fetch Reddit posts for %s: %s", symbol, exc)
         return []
 
@@ -125,27 +216,19 @@ def compute_sentiment(texts: Iterable[str]) -> float:
         Aggregate sentiment score.  Returns 0.0 if no texts are
         provided.
     """
-    count = 0
-    score = 0.0
-    for text in texts:
-        count += 1
-        lowered = text.lower()
-        # Tokenise by splitting on non‑alphanumeric characters.  This is
-        # intentionally simple and should be replaced with a proper NLP
-        # tokenizer when dependencies permit.
-        tokens = re.split(r"[^a-z0-9$]+", lowered)
-        # Compute scores for this text
-        pos_score = sum(POSITIVE_KEYWORDS.get(tok, 0.0) for tok in tokens)
-        neg_score = sum(NEGATIVE_KEYWORDS.get(tok, 0.0) for tok in tokens)
-        score += pos_score - neg_score
+    texts = list(texts)
+    count = len(texts)
+    # Keywords are matched as whole tokens separated by
+    # non‑alphanumeric characters.  This is intentionally simple and
+    # should be replaced with a proper NLP tokenizer when dependencies
+    # permit.  The texts are scored as one newline‑joined batch; the
+    # newline is a separator, so no token spans two texts.
+    score = _score_text("\n".join(texts).lower())
     if count == 0:
         return 0.0
     # Normalise by the maximum possible absolute score per post to keep
     # values in a manageable range.  Here we use the sum of all weights.
-    max_pos = sum(POSITIVE_KEYWORDS.values())
-    max_neg = sum(NEGATIVE_KEYWORDS.values())
-    max_score = max(max_pos, max_neg)
-    return score / (count * max_score) if max_score > 0 else 0.0
+    return score / (count * _MAX_SCORE) if _MAX_SCORE > 0 else 0.0
 
 
 def get_sentiment_for_symbol(symbol: str, limit: int = 50) -> float:
@@ -168,4 +251,8 @@ def get_sentiment_for_symbol(symbol: str, limit: int = 50) -> float:
     return compute_sentiment(posts)
 
 
-__all__ = ["fetch_recent_posts", "compute_sentiment", "get_sentiment_for_symbol"]
\ No newline at end of file
+__all__ = [
+    "fetch_recent_posts",
+    "compute_sentiment",
+    "get_sentiment_for_symbol",
+]
\ No newline at end of file
@@ -16,7 +16,7 @@ from __future__ import annotations
 
 from typing import Dict, List, Optional
 
-from . import config
+import config
 
 
 def _analyze_flows(flows: List[Dict[str, any]]) -> Optional[float]:
@@ -70,50 +70,53 @@ def generate_signal(symbol: str, flows: List[Dict[str, any]], sentiment: float,
         Contains the symbol, a signal ("buy", "sell" or "hold") and a
         human‑readable reason summarising the inputs.
     """
-    reason_parts: List[str] = []
+    threshold = config.SENTIMENT_THRESHOLD
     flow_strength = _analyze_flows(flows)
     if flow_strength is not None:
-        reason_parts.append(f"Flow strength {flow_strength:.2f}")
+        flow_desc = f"Flow strength {flow_strength:.2f}"
     else:
-        reason_parts.append("No flow data")
+        flow_desc = "No flow data"
     # Interpret sentiment
-    if sentiment > config.SENTIMENT_THRESHOLD:
+    if sentiment > threshold:
         sent_desc = f"Bullish sentiment ({sentiment:+.2f})"
-    elif sentiment < -config.SENTIMENT_THRESHOLD:
+    elif sentiment < -threshold:
         sent_desc = f"Bearish sentiment ({sentiment:+.2f})"
     else:
         sent_desc = f"Neutral sentiment ({sentiment:+.2f})"
-    reason_parts.append(sent_desc)
-    # Evaluate fundamentals
+    # Evaluate fundamentals.  Fall back to forward PE only when trailing
+    # PE is missing, not when it is zero.
     pe = None
     if fundamentals:
-        pe = fundamentals.get("trailingPE") or fundamentals.get("forwardPE")
-        if pe is not None:
-            reason_parts.append(f"PE {pe:.1f}")
+        pe = fundamentals.get("trailingPE")
+        if pe is None:
+            pe = fundamentals.get("forwardPE")
     # Decision logic
-    signal: str = "hold"
     # Buy conditions: bullish flow, bullish sentiment, reasonable valuation
     if (
         flow_strength is not None
         and flow_strength > 0.6
-        and sentiment > config.SENTIMENT_THRESHOLD
+        and sentiment > threshold
         and (pe is None or pe < 30)
     ):
         signal = "buy"
-        reason_parts.append("High call activity + bullish sentiment + attractive PE")
+        decision_desc = "High call activity + bullish sentiment + attractive PE"
     # Sell conditions: bearish flow, bearish sentiment, expensive valuation
     elif (
         flow_strength is not None
         and flow_strength < 0.4
-        or sentiment < -config.SENTIMENT_THRESHOLD
+        or sentiment < -threshold
         or (pe is not None and pe > 50)
     ):
         signal = "sell"
-        reason_parts.append("Bearish conditions outweigh positives")
+        decision_desc = "Bearish conditions outweigh positives"
     else:
         signal = "hold"
-        reason_parts.append("Mixed signals; stay neutral")
-    return {"symbol": symbol, "signal": signal, "reason": "; ".join(reason_parts)}
+        decision_desc = "Mixed signals; stay neutral"
+    if pe is not None:
+        reason = f"{flow_desc}; {sent_desc}; PE {pe:.1f}; {decision_desc}"
+    else:
+        reason = f"{flow_desc}; {sent_desc}; {decision_desc}"
+    return {"symbol": symbol, "signal": signal, "reason": reason}
 
 
 __all__ = ["generate_signal"]
\ No newline at end of file
@@ -0,0 +1,36 @@
+import unittest
+from unittest import mock
+
+import fundamentals
+
+
+def _response(body: bytes) -> mock.Mock:
+    response = mock.Mock(content=body)
+    response.raise_for_status.return_value = None
+    return response
+
+
+class GetFundamentalsBatchTest(unittest.TestCase):
+    def fetch(self, body: bytes):
+        with mock.patch.object(fundamentals._SESSION, "get", return_value=_response(body)):
+            with self.assertLogs(fundamentals.logger, level="WARNING"):
+                return fundamentals.get_fundamentals_batch(["AAPL"])
+
+    def test_top_level_list_returns_empty(self):
+        self.assertEqual(self.fetch(b"[1]"), {})
+
+    def test_quote_response_not_a_dict_returns_empty(self):
+        self.assertEqual(self.fetch(b'{"quoteResponse": []}'), {})
+
+    def test_null_result_returns_empty(self):
+        self.assertEqual(self.fetch(b'{"quoteResponse": {"result": null}}'), {})
+
+    def test_valid_payload(self):
+        body = b'{"quoteResponse": {"result": [{"symbol": "aapl", "trailingPE": 12}]}}'
+        with mock.patch.object(fundamentals._SESSION, "get", return_value=_response(body)):
+            batch = fundamentals.get_fundamentals_batch(["AAPL"])
+        self.assertEqual(batch["AAPL"]["trailingPE"], 12.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -14,33 +14,62 @@ return empty lists to avoid interrupting downstream processing.
 
 from __future__ import annotations
 
-import json
 import logging
+from datetime import timedelta
 from typing import Any, Dict, List, Optional
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from requests_cache import CachedSession
+from urllib3.util.retry import Retry
 
 import config
 
 
-
 logger = logging.getLogger(__name__)
 
 # Base URL for the Unusual Whales REST API.  This may change in future
 # versions of the service; update as necessary.
 BASE_URL = "https://api.unusualwhales.com"
 
-
-def _get_headers() -> Dict[str, str]:
-    """Return HTTP headers for API requests.
-
-    If an API key is configured, it is included as an Authorization
-    header using the bearer token format.  Without a key the header
-    dictionary is empty.
-    """
-    if config.UNUSUAL_WHALES_API_KEY:
-        return {"Authorization": f"Bearer {config.UNUSUAL_WHALES_API_KEY}"}
-    return {}
+# Errors that make a fetch return its empty fallback.  Malformed JSON
+# surfaces as ``orjson.JSONDecodeError``, a ``ValueError`` subclass.
+_SYNC_ERRORS = (requests.RequestException, ValueError)
+
+# Shared HTTP session.  Reusing a session keeps connections alive
+# between calls so only the first request pays the TCP/TLS handshake.
+# Responses are cached on disk for ``config.POLL_INTERVAL`` seconds (or
+# as the server's cache headers dictate) so that rapid repeated runs
+# reuse recent flow data.
+# The cache lives in the user's cache directory so it does not depend
+# on the working directory.
+_SESSION = CachedSession(
+    "trading_assistant_unusual_whales",
+    use_cache_dir=True,
+    backend="sqlite",
+    expire_after=timedelta(seconds=config.POLL_INTERVAL),
+    allowable_codes=(200,),
+    cache_control=True,
+)
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[429, 502, 503, 504]),
+    ),
+)
+
+
+# Request headers, built once since the API key is fixed at import.
+# If a key is configured it is sent as a bearer token; otherwise no
+# headers are added.  Shared between calls, so it must not be mutated.
+_HEADERS: Dict[str, str] = (
+    {"Authorization": f"Bearer {config.UNUSUAL_WHALES_API_KEY}"}
+    if config.UNUSUAL_WHALES_API_KEY
+    else {}
+)
 
 
 def get_recent_flow(symbol: str, limit: int = 20) -> List[Dict[str, Any]]:
@@ -59,24 +88,40 @@ def get_recent_flow(symbol: str, limit: int = 20) -> List[Dict[str, Any]]:
         Each dictionary contains details about a single options flow
         trade.  When no API key is configured or an error occurs an
         empty list is returned.
+
+    Notes
+    -----
+    When streaming is enabled (see ``config.UNUSUAL_WHALES_STREAM``)
+    entries are served from the local WebSocket buffer maintained by
+    :mod:`unusual_whales_ws`.  The REST endpoint is only queried while
+    that buffer is still empty for ``symbol``.
     """
     # Avoid making requests if no API key is present.
     if not config.UNUSUAL_WHALES_API_KEY:
         logger.debug("Unusual Whales API key not provided; returning empty flow data for %s", symbol)
         return []
+    if config.UNUSUAL_WHALES_STREAM:
+        # Imported lazily so that websockets is only required when
+        # streaming is enabled.
+        import unusual_whales_ws
+
+        if unusual_whales_ws.start():
+            buffered = unusual_whales_ws.get_buffered_flow(symbol, limit)
+            if buffered:
+                return buffered
     endpoint = f"{BASE_URL}/stock/flow/recent"
     params = {"symbol": symbol, "limit": limit}
     try:
-        response = requests.get(endpoint, headers=_get_headers(), params=params, timeout=10)
+        response = _SESSION.get(endpoint, headers=_HEADERS, params=params, timeout=10)
         response.raise_for_status()
-        data: Dict[str, Any] = response.json()
+        data: Dict[str, Any] = orjson.loads(response.content)
         # The API returns either {"data": [...] } or a raw list.  Normalize to a list.
         flows = data.get("data") if isinstance(data, dict) else data
         if not isinstance(flows, list):
             logger.warning("Unexpected flow response format for %s: %s", symbol, data)
             return []
         return flows  # type: ignore[return-value]
-    except Exception as exc:
+    except _SYNC_ERRORS as exc:
         logger.error("Failed to fetch flow data for %s: %s", symbol, exc)
         return []
 
@@ -98,11 +143,11 @@ def get_market_tide() -> Optional[Dict[str, Any]]:
         return None
     endpoint = f"{BASE_URL}/market/tide"
     try:
-        response = requests.get(endpoint, headers=_get_headers(), timeout=10)
+        response = _SESSION.get(endpoint, headers=_HEADERS, timeout=10)
         response.raise_for_status()
-        data: Dict[str, Any] = response.json()
+        data: Dict[str, Any] = orjson.loads(response.content)
         return data  # May contain fields like {'tide': 0.65, 'updated': '2025-09-16T16:00:00Z'}
-    except Exception as exc:
+    except _SYNC_ERRORS as exc:
         logger.error("Failed to fetch market tide data: %s", exc)
         return None
 
@@ -0,0 +1,116 @@
+"""Unusual Whales options flow over WebSocket.
+
+Polling the REST API costs a full request/response cycle per call.
+This module instead subscribes once per process to the streaming feed
+and keeps a rolling in‑memory buffer of the most recent flow entries
+for each symbol.  Readers such as ``unusual_whales.get_recent_flow``
+then serve data from the warm local buffer without touching the
+network.
+
+The stream runs on a daemon thread with its own event loop, so it can
+be used from both synchronous and asynchronous code.  It is only
+started when ``config.UNUSUAL_WHALES_STREAM`` is enabled and an API key
+is configured.  The stream URL and message format are based on the
+REST API and may need adjustment if the service changes; messages that
+cannot be attributed to a symbol are ignored.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from collections import defaultdict, deque
+from typing import Any, Deque, Dict, List, Optional
+
+import orjson
+from websockets.asyncio.client import connect
+from websockets.exceptions import WebSocketException
+
+import config
+
+
+logger = logging.getLogger(__name__)
+
+# WebSocket endpoint for the flow feed.
+STREAM_URL = "wss://api.unusualwhales.com/stream"
+
+# Number of flow entries retained per symbol.
+BUFFER_SIZE = 100
+
+# Seconds to wait before reconnecting after the stream drops.
+RECONNECT_DELAY = 5.0
+
+# Errors after which the stream reconnects.  Anything else is a bug and
+# is left to surface instead of being retried forever.
+_STREAM_ERRORS = (OSError, asyncio.TimeoutError, WebSocketException)
+
+BUFFERS: Dict[str, Deque[Dict[str, Any]]] = defaultdict(lambda: deque(maxlen=BUFFER_SIZE))
+_LOCK = threading.Lock()
+_THREAD: Optional[threading.Thread] = None
+
+
+def _record(message: Any) -> None:
+    """Append a decoded stream message to its symbol's buffer."""
+    entries = message.get("data", message) if isinstance(message, dict) else message
+    if isinstance(entries, dict):
+        entries = [entries]
+    if not isinstance(entries, list):
+        return
+    with _LOCK:
+        for entry in entries:
+            if not isinstance(entry, dict):
+                continue
+            symbol = entry.get("symbol") or entry.get("ticker")
+            if isinstance(symbol, str):
+                BUFFERS[symbol.upper()].append(entry)
+
+
+async def _run() -> None:
+    """Receive flow messages forever, reconnecting when the stream drops."""
+    headers = {"Authorization": f"Bearer {config.UNUSUAL_WHALES_API_KEY}"}
+    while True:
+        try:
+            async with connect(STREAM_URL, additional_headers=headers) as ws:
+                logger.info("Connected to Unusual Whales flow stream")
+                async for raw in ws:
+                    try:
+                        _record(orjson.loads(raw))
+                    except orjson.JSONDecodeError:
+                        logger.debug("Ignoring undecodable stream message: %r", raw)
+        except _STREAM_ERRORS as exc:
+            logger.warning("Unusual Whales flow stream error: %s", exc)
+        await asyncio.sleep(RECONNECT_DELAY)
+
+
+def start() -> bool:
+    """Start the background stream if enabled and not already running.
+
+    Returns
+    -------
+    bool
+        ``True`` if the stream is running after the call.
+    """
+    global _THREAD
+    if not (config.UNUSUAL_WHALES_STREAM and config.UNUSUAL_WHALES_API_KEY):
+        return False
+    with _LOCK:
+        if _THREAD is None:
+            _THREAD = threading.Thread(
+                target=asyncio.run, args=(_run(),), name="uw-flow-stream", daemon=True
+            )
+            _THREAD.start()
+    return True
+
+
+def get_buffered_flow(symbol: str, limit: int = 20) -> List[Dict[str, Any]]:
+    """Return up to ``limit`` buffered flow entries for ``symbol``, newest first."""
+    with _LOCK:
+        buffer = BUFFERS.get(symbol.upper())
+        if not buffer:
+            return []
+        entries = list(buffer)
+    return entries[:-limit - 1:-1]
+
+
+__all__ = ["start", "get_buffered_flow", "BUFFERS"]